@@ -15,11 +15,23 @@ const PoliticiansGallery = ({ politicians }) => {
               className="bg-white rounded-lg shadow-lg overflow-hidden border-l-4 hover:shadow-xl transition-shadow"
               style={{ borderColor: politician.card_color }}
             >
-              <img
-                src={politician.image}
-                alt={politician.name}
-                className="w-full h-48 object-cover"
-              />
+              {/* Seules les variantes réellement encodées sont annoncées
+                  (image_avif/image_webp dans la config): un navigateur
+                  retient la première <source> au type supporté et ne
+                  retombe pas sur <img> quand elle répond 404. */}
+              <picture>
+                {politician.image_avif && (
+                  <source srcSet={politician.image_avif} type="image/avif" />
+                )}
+                {politician.image_webp && (
+                  <source srcSet={politician.image_webp} type="image/webp" />
+                )}
+                <img
+                  src={politician.image}
+                  alt={politician.name}
+                  className="w-full h-48 object-cover"
+                />
+              </picture>
               <div className="p-4">
                 <h3 className="font-bold text-lg mb-2">{politician.name}</h3>
                 <p className="text-sm text-gray-600 mb-3">{politician.party}</p>
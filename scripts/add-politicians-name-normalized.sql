@@ -0,0 +1,18 @@
+-- Normalized name column for exact, index-usable lookups from
+-- scripts/update_politicians_assets.py (replaces ilike '%name%' scans).
+-- Run once in the Supabase SQL editor.
+
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+-- unaccent() is only STABLE; generated columns need an IMMUTABLE wrapper
+CREATE OR REPLACE FUNCTION immutable_unaccent(text)
+RETURNS text AS $$
+  SELECT public.unaccent('public.unaccent', $1)
+$$ LANGUAGE sql IMMUTABLE;
+
+ALTER TABLE politicians
+  ADD COLUMN IF NOT EXISTS name_normalized TEXT
+  GENERATED ALWAYS AS (lower(immutable_unaccent(name))) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_politicians_name_normalized
+  ON politicians (name_normalized);
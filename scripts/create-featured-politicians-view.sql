@@ -0,0 +1,19 @@
+-- View backing the featured-politicians sections (gallery, side-by-side videos)
+-- Run once in the Supabase SQL editor before using scripts/update_politicians_assets.py
+
+-- Columns written by the asset updater (no-op if already present)
+ALTER TABLE politicians ADD COLUMN IF NOT EXISTS avatar_url TEXT;
+ALTER TABLE politicians ADD COLUMN IF NOT EXISTS animation_url TEXT;
+ALTER TABLE politicians ADD COLUMN IF NOT EXISTS highlight BOOLEAN DEFAULT FALSE;
+
+-- Sort + featured flag computed server-side instead of on every client
+CREATE OR REPLACE VIEW featured_politicians AS
+SELECT *, (animation_url IS NOT NULL) AS is_featured
+FROM politicians
+WHERE avatar_url IS NOT NULL
+ORDER BY credibility_score DESC, highlight DESC;
+
+-- Partial index matching the view's filter and sort order
+CREATE INDEX IF NOT EXISTS idx_politicians_featured
+  ON politicians (credibility_score DESC, highlight DESC)
+  WHERE avatar_url IS NOT NULL;
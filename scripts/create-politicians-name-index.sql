@@ -0,0 +1,22 @@
+-- Unique index backing the populate script's upsert on (first_name, last_name)
+-- Run once in the Supabase SQL editor before using scripts/populate_politicians_db.py
+
+-- Remove duplicates left by earlier plain-insert runs (keep the oldest row,
+-- case-insensitively so "Le Pen" and "LE PEN" collapse to one row).
+-- ctid breaks created_at ties: rows inserted by one statement (array insert,
+-- one populate run) share a timestamp and would otherwise survive in pairs,
+-- failing the unique index below.
+DELETE FROM politicians p
+USING politicians older
+WHERE lower(p.first_name) = lower(older.first_name)
+  AND lower(p.last_name) = lower(older.last_name)
+  AND (p.created_at > older.created_at
+       OR (p.created_at = older.created_at AND p.ctid > older.ctid));
+
+-- Plain column index, not an expression index: PostgREST compiles
+-- on_conflict='first_name,last_name' to ON CONFLICT (first_name, last_name),
+-- and Postgres cannot infer an expression index from a plain column list
+-- (every upsert would fail with 42P10). Case variants are collapsed by the
+-- DELETE above and by the script's own dedup pass.
+CREATE UNIQUE INDEX IF NOT EXISTS idx_politicians_name_unique
+  ON politicians (first_name, last_name);
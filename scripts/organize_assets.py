@@ -0,0 +1,803 @@
+#!/usr/bin/env python3
+"""
+🔥 POLITIKCRED Assets Optimizer
+Organise les assets bruts (logos, portraits, animations) dans public/assets
+et génère la config JSON, les composants JSX et le CSS de la direction artistique.
+
+Usage:
+    python3 scripts/organize_assets.py [source_dir] [--move] [--verbose]
+
+source_dir defaults to ./assets-source (the raw export from the design drive).
+--move renames the source files into place instead of copying them. Only stale,
+classified assets leave the source directory: files whose destination is already
+current are skipped, and unclassified files are never touched. Only applies when
+source and destination live on the same filesystem; otherwise we fall back to
+copying.
+--verbose logs every scanned/copied file (one write+flush per line, so it is
+off by default for large asset drops).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+from politikcred_asset_templates import (
+    CSS_BYTES,
+    FEATURED_JSX_BYTES,
+    GALLERY_JSX_BYTES,
+    HERO_JSX_BYTES,
+)
+
+logger = logging.getLogger("politikcred")
+
+
+def _setup_logging(verbose=False):
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    # Per-file lines are DEBUG: each record is a stdout write+flush, which
+    # dominates runtime on directories with hundreds of assets.
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    # C encoder, ~5-10x faster than stdlib json for indented output
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Pillow (or Pillow-SIMD for SSE4/AVX2 color conversion) for real WebP output
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    # C multi-pattern matcher; one linear scan of the stem finds every keyword
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+if Image is not None:
+    try:
+        # Registers the AVIF encoder with Pillow on import; AV1 intra coding
+        # beats WebP by ~30-50% on the gradient-heavy cartoon portraits
+        import pillow_avif  # noqa: F401
+        HAVE_AVIF = True
+    except ImportError:
+        HAVE_AVIF = False
+else:
+    HAVE_AVIF = False
+
+# Linux reflink ioctl (btrfs/xfs); value is stable across architectures we care about
+FICLONE = getattr(fcntl, "FICLONE", 0x40049409) if fcntl else None
+
+# macOS clonefile(2): APFS shares extents until modification, so cloning the
+# big MP4s is O(metadata) regardless of size
+_clonefile = None
+if sys.platform == "darwin":
+    import ctypes
+
+    try:
+        _libc = ctypes.CDLL("libc.dylib", use_errno=True)
+        _libc.clonefile.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int)
+        _clonefile = _libc.clonefile
+    except (OSError, AttributeError):
+        _clonefile = None
+
+# Single-pass classifier: one precompiled automaton run per filename instead
+# of chained endswith + substring scans. Alternatives are ordered like the old
+# if/elif cascade ("hemi" videos must win over "animated" ones, etc.).
+CLASSIFIER = re.compile(
+    r"^(?:"
+    r"(?P<logo>.*(?:logo|icon).*)"
+    r"|(?P<hemicycle>.*hemicycle.*)"
+    r"|(?P<portrait>.*(?:borne|lecornu|lombart|lepen).*|\d+)"
+    r")\.(?P<img>png|jpe?g)$"
+    r"|^(?:"
+    r"(?P<hero>.*hemi.*)"
+    r"|(?P<animation>.*(?:lecornu|lepen|animated).*)"
+    r")\.(?P<vid>mp4|mov)$",
+    re.IGNORECASE,
+)
+
+# Keyword tables driving the Aho-Corasick fast path. Group precedence mirrors
+# the regex alternation order; keywords stay substring matches.
+CLASSIFIER_KEYWORDS = {
+    "logo": ("logo", "icon"),
+    "hemicycle": ("hemicycle",),
+    "portrait": ("borne", "lecornu", "lombart", "lepen"),
+    "hero": ("hemi",),
+    "animation": ("lecornu", "lepen", "animated"),
+}
+IMAGE_GROUP_ORDER = ("logo", "hemicycle", "portrait")
+VIDEO_GROUP_ORDER = ("hero", "animation")
+IMAGE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg"})
+VIDEO_SUFFIXES = frozenset({".mp4", ".mov"})
+
+_AUTOMATON = None
+if ahocorasick is not None:
+    _word_groups = {}
+    for _group, _keywords in CLASSIFIER_KEYWORDS.items():
+        for _keyword in _keywords:
+            _word_groups.setdefault(_keyword, set()).add(_group)
+    _AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _groups in _word_groups.items():
+        _AUTOMATON.add_word(_keyword, frozenset(_groups))
+    _AUTOMATON.make_automaton()
+
+
+def _classify(name):
+    """Return the (classifier group, lowercased stem) for a filename, or None.
+
+    With pyahocorasick installed, a single automaton.iter pass over the stem
+    collects every keyword hit at once — O(len(stem)) no matter how many
+    politicians the tables grow to. Otherwise the precompiled regex runs.
+    """
+    if _AUTOMATON is not None:
+        dot = name.rfind(".")
+        if dot <= 0:
+            return None
+        stem = name[:dot].lower()
+        ext = name[dot:].lower()
+        if ext in IMAGE_SUFFIXES:
+            order = IMAGE_GROUP_ORDER
+        elif ext in VIDEO_SUFFIXES:
+            order = VIDEO_GROUP_ORDER
+        else:
+            return None
+        hits = set()
+        for _, groups in _AUTOMATON.iter(stem):
+            hits |= groups
+        if order is IMAGE_GROUP_ORDER and stem.isdigit():
+            hits.add("portrait")
+        for group in order:
+            if group in hits:
+                return group, stem
+        return None
+
+    match = CLASSIFIER.match(name)
+    if match is None:
+        return None
+    stem = name[:name.rfind(".")].lower()
+    for group in CLASSIFIER_DISPATCH:
+        if match.group(group) is not None:
+            return group, stem
+    return None
+
+@dataclass(slots=True)
+class AssetRecord:
+    """Classified source asset. Slotted: ~3x smaller than the dict literals
+    it replaces, and attribute access is an indexed load instead of a hash
+    probe in the copy loop."""
+    file: str
+    path: str
+    optimization: str
+    usage: str | None = None
+    politician: str | None = None
+    style: str | None = None
+    loop: bool = False
+    fullscreen: bool = False
+    compatible_ratio: bool = False
+
+
+# Assets bucket -> (destination folder key, log label)
+TRANSFER_DISPATCH = {
+    "logo": ("logo", "📋 Logo"),
+    "backgrounds": ("backgrounds", "🌅 Background"),
+    "politicians_static": ("politicians", "👤 Politicien"),
+    "politicians_animated": ("animations", "🎬 Animation"),
+}
+
+# Matched group name -> (assets bucket, record factory)
+CLASSIFIER_DISPATCH = {
+    "logo": ("logo", lambda name, path, stem: AssetRecord(
+        file=name,
+        path=path,
+        usage="header_navigation",
+        optimization="webp_conversion",
+    )),
+    "hemicycle": ("backgrounds", lambda name, path, stem: AssetRecord(
+        file=name,
+        path=path,
+        usage="hero_fallback",
+        optimization="webp_conversion",
+    )),
+    "portrait": ("politicians_static", lambda name, path, stem: AssetRecord(
+        file=name,
+        path=path,
+        politician=stem,
+        style="cartoon_portrait",
+        optimization="webp_conversion",
+    )),
+    "hero": ("backgrounds", lambda name, path, stem: AssetRecord(
+        file=name,
+        path=path,
+        usage="hero_background",
+        loop=True,
+        fullscreen=True,
+        optimization="compression_streaming",
+    )),
+    "animation": ("politicians_animated", lambda name, path, stem: AssetRecord(
+        file=name,
+        path=path,
+        politician=stem,
+        compatible_ratio=True,
+        optimization="compression_streaming",
+    )),
+}
+
+
+def _fast_copy(src, dst):
+    """Copy file bytes using the fastest kernel path available.
+
+    Tries, in order: clonefile on macOS/APFS, FICLONE reflink (same-device
+    CoW filesystems on Linux), os.sendfile (zero user-space copies), then a
+    plain buffered copy.
+
+    Only bytes are copied: the web server never reads mtime/mode/xattrs, so
+    the stat/utime/chmod round of copystat is skipped. The freshness check
+    in _is_up_to_date treats an equal-size, newer destination as current,
+    so it keeps working without the mirrored mtime.
+    """
+    src = os.fspath(src)
+    dst = os.fspath(dst)
+
+    # 0. APFS reflink: clonefile refuses to overwrite, so clear the target first
+    if _clonefile is not None:
+        try:
+            os.unlink(dst)
+        except FileNotFoundError:
+            pass
+        if _clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+            return
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        copied = False
+
+        # 1. Reflink: O(metadata) copy-on-write clone when src/dst share a device
+        if FICLONE is not None:
+            try:
+                dst_dir = os.path.dirname(dst) or "."
+                if os.fstat(fsrc.fileno()).st_dev == os.stat(dst_dir).st_dev:
+                    fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                    copied = True
+            except OSError:
+                copied = False
+
+        # 2. sendfile: kernel-to-kernel transfer, no Python-level buffers
+        if not copied and hasattr(os, "sendfile"):
+            try:
+                size = os.fstat(fsrc.fileno()).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                copied = offset >= size
+            except OSError:
+                copied = False
+
+        # 3. Portable fallback
+        if not copied:
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst)
+
+
+WEBP_SOURCE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg"})
+
+# Widths referenced by <img srcset>, descending so each resize below works
+# from the previous (smaller, cache-resident) buffer instead of re-decoding.
+SRCSET_WIDTHS = (1920, 1200, 768, 480)
+
+
+def _encode_webp(source_path, dest_path):
+    """Encode WebP variants next to the copied original.
+
+    WebP runs 25-34% smaller than PNG/JPEG at equivalent quality, and an
+    AVIF sibling (when the encoder plugin is present) roughly halves that
+    again on photographic portraits; the original stays in place as the
+    <picture> fallback. PNG sources are encoded lossless for WebP (cartoon
+    flats), photos go through lossy q82.
+
+    The source is decoded exactly once; responsive widths are produced by
+    thumbnailing the same buffer in descending order. Returns the srcset
+    string for the emitted variants ("" when the source is too small).
+    """
+    lossless = source_path.suffix.lower() == ".png"
+    save_opts = {"quality": 82, "method": 6, "lossless": lossless}
+    # speed=4 is libavif's sweet spot: ~5% larger than slower settings but
+    # several times faster to encode
+    avif_opts = {"quality": 60, "speed": 4}
+    web_dir = f"/assets/{dest_path.parent.name}"
+    stem = dest_path.stem
+    entries = []
+
+    with Image.open(source_path) as im:
+        im.load()
+        im.save(dest_path.with_suffix(".webp"), "WEBP", **save_opts)
+        if HAVE_AVIF:
+            im.save(dest_path.with_suffix(".avif"), "AVIF", **avif_opts)
+        for width in SRCSET_WIDTHS:
+            if im.width < width:
+                continue  # never upscale
+            im.thumbnail((width, 10 ** 9), Image.LANCZOS)
+            im.save(dest_path.with_name(f"{stem}-{width}.webp"), "WEBP", **save_opts)
+            if HAVE_AVIF:
+                im.save(dest_path.with_name(f"{stem}-{width}.avif"), "AVIF", **avif_opts)
+            entries.append(f"{web_dir}/{stem}-{width}.webp {width}w")
+
+    return ", ".join(entries)
+
+
+def _file_digest(path):
+    """blake2b content digest over an mmap of the file.
+
+    Mapping instead of a read() loop hashes straight out of the page cache
+    with no intermediate bytes objects — the MP4 assets are tens of MB, so
+    this halves memory traffic. MADV_SEQUENTIAL hints the prefetcher where
+    available. Empty files cannot be mapped and hash trivially.
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return digest.digest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            digest.update(mm)
+    return digest.digest()
+
+
+def _is_up_to_date(src, dst):
+    """make-style freshness check: True when dst already holds src's bytes.
+
+    Fast path compares (st_size, st_mtime_ns) — a same-size destination at
+    least as new as the source is current. When the source is newer, fall
+    back to comparing content digests, which is still cheaper than an
+    unconditional re-copy.
+    """
+    try:
+        s = os.stat(src)
+        d = os.stat(dst)
+    except FileNotFoundError:
+        return False
+    if s.st_size != d.st_size:
+        return False
+    if s.st_mtime_ns <= d.st_mtime_ns:
+        return True
+    return _file_digest(src) == _file_digest(dst)
+
+
+def _variants_up_to_date(dst):
+    """True when dst's full-size WebP sibling is at least as new as dst.
+
+    Same make-style idea as _is_up_to_date, but against the encode output:
+    size comparison is meaningless across formats, so mtime ordering alone
+    decides whether the variants need regenerating.
+    """
+    try:
+        return os.stat(dst.with_suffix(".webp")).st_mtime_ns >= os.stat(dst).st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def _existing_srcset(dst):
+    """Srcset string for the responsive variants already on disk next to dst.
+
+    Mirrors the entries _encode_webp would emit, so a skipped encode still
+    feeds the generated config the same srcset as a fresh one.
+    """
+    web_dir = f"/assets/{dst.parent.name}"
+    return ", ".join(
+        f"{web_dir}/{dst.stem}-{width}.webp {width}w"
+        for width in SRCSET_WIDTHS
+        if dst.with_name(f"{dst.stem}-{width}.webp").exists()
+    )
+
+
+def _write_all(pairs):
+    """Write (path, bytes) pairs with raw os.open/os.write.
+
+    Skips the TextIOWrapper layer (codec + line buffering) since the
+    generated components/CSS are pre-encoded byte strings.
+    """
+    for path, data in pairs:
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+
+class PolitikCredAssetsOptimizer:
+    """Classe et organise les assets visuels POLITIKCRED."""
+
+    def __init__(self, images_dir=None, move_mode=False):
+        self.project_root = Path(__file__).resolve().parent.parent
+        self.images_dir = Path(images_dir) if images_dir else self.project_root / "assets-source"
+        self.output_dir = self.project_root / "public" / "assets"
+        self.move_mode = move_mode
+        self.assets_config = {}
+        self.srcsets = {}
+
+    def analyze_assets(self):
+        """Analyse les fichiers source et les classe par usage."""
+        logger.info("🎨 ANALYSE DES ASSETS POLITIKCRED")
+        logger.info("=" * 50)
+
+        # Records are collected flat and partitioned once at the end: the
+        # per-bucket lists are then built by comprehension in a single pass
+        # instead of growing four lists through interleaved appends.
+        classified = []
+        total_files = 0
+        # os.scandir exposes is_file() from the readdir buffer: one directory
+        # read, no extra stat per entry (iterdir + is_file costs both).
+        with os.scandir(self.images_dir) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                total_files += 1
+
+                name = entry.name
+                logger.debug("🔍 Analyse: %s", name)
+
+                result = _classify(name)
+                if result is None:
+                    continue
+                group, stem = result
+                bucket, build = CLASSIFIER_DISPATCH[group]
+                classified.append((bucket, build(name, entry.path, stem)))
+
+        assets = {
+            bucket: [record for b, record in classified if b == bucket]
+            for bucket in ("logo", "backgrounds", "politicians_static", "politicians_animated")
+        }
+        self.assets_config = assets
+
+        logger.info(f"\n📊 RÉSULTATS:")
+        logger.info(f"   Logos: {len(assets['logo'])}")
+        logger.info(f"   Backgrounds: {len(assets['backgrounds'])}")
+        logger.info(f"   Politiciens statiques: {len(assets['politicians_static'])}")
+        logger.info(f"   Politiciens animés: {len(assets['politicians_animated'])}")
+        logger.info(f"   Total fichiers scannés: {total_files}")
+
+        return assets
+
+    def create_assets_structure(self):
+        """Crée l'arborescence public/assets."""
+        logger.info("\n📁 CRÉATION DE LA STRUCTURE")
+        logger.info("=" * 50)
+
+        structure = {
+            "logo": self.output_dir / "logo",
+            "backgrounds": self.output_dir / "backgrounds",
+            "politicians": self.output_dir / "politicians",
+            "animations": self.output_dir / "animations",
+            "components": self.output_dir / "components"
+        }
+
+        # mkdir(parents=True, exist_ok=True) stats every ancestor per call; on
+        # re-runs all folders already exist, so list the output dir once and
+        # only mkdir what is actually missing.
+        os.makedirs(self.output_dir, exist_ok=True)
+        with os.scandir(self.output_dir) as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+
+        for folder_name, folder_path in structure.items():
+            if folder_path.name not in existing:
+                folder_path.mkdir(parents=True, exist_ok=True)
+            logger.info(f"✅ {folder_name}: {folder_path}")
+
+        return structure
+
+    def optimize_and_organize(self):
+        """Copie les assets classés vers leurs dossiers de destination."""
+        logger.info("\n🚀 ORGANISATION DES ASSETS")
+        logger.info("=" * 50)
+
+        structure = self.create_assets_structure()
+
+        # Same-filesystem rename is an O(1) metadata update vs an O(filesize)
+        # byte copy; only usable in --move mode since it empties the source dir.
+        same_fs = self.images_dir.stat().st_dev == structure["logo"].stat().st_dev
+        transfer = os.replace if (self.move_mode and same_fs) else _fast_copy
+        if self.move_mode and not same_fs:
+            logger.info("⚠️ --move demandé mais source et destination sont sur des filesystems différents, copie classique")
+
+        jobs = []
+        for asset_type, assets in self.assets_config.items():
+            folder_key, label = TRANSFER_DISPATCH[asset_type]
+            dest_folder = structure[folder_key]
+            for asset in assets:
+                source_path = Path(asset.path)
+                jobs.append((label, source_path, dest_folder / source_path.name))
+
+        # Static images additionally get a WebP variant when Pillow is around;
+        # without it the script degrades to a plain copy like before.
+        # Encodes read the destination copy, never the source: in --move mode
+        # the transfer is os.replace, so the source vanishes as soon as its
+        # move lands — each encode is chained after its own transfer below.
+        encode_dests = []
+        if Image is not None:
+            for label, src, dst in jobs:
+                if src.suffix.lower() in WEBP_SOURCE_SUFFIXES and dst.parent.name in ("politicians", "backgrounds"):
+                    encode_dests.append(dst)
+
+        # Incremental runs: drop transfers whose destination is already current
+        # so re-running the script after adding one asset moves one file.
+        pending = []
+        skipped = 0
+        for label, src, dst in jobs:
+            if _is_up_to_date(src, dst):
+                skipped += 1
+                logger.debug("⏭ À jour: %s", src.name)
+            else:
+                pending.append((label, src, dst))
+        if skipped:
+            logger.info(f"⏭ {skipped} asset(s) déjà à jour, copie ignorée")
+        jobs = pending
+
+        # Variants get their own freshness check against the .webp output:
+        # a current original whose variants exist is not re-encoded, and a
+        # missing variant is produced even when every copy is up to date.
+        # Skipped encodes still feed self.srcsets from the files on disk so
+        # the generated config stays complete across incremental runs.
+        pending_dsts = {dst for _, _, dst in jobs}
+        stale_encodes = []
+        for dst in encode_dests:
+            if dst in pending_dsts or not _variants_up_to_date(dst):
+                stale_encodes.append(dst)
+            else:
+                srcset = _existing_srcset(dst)
+                if srcset:
+                    self.srcsets[dst.stem] = srcset
+        if len(stale_encodes) < len(encode_dests):
+            logger.info(f"⏭ {len(encode_dests) - len(stale_encodes)} variante(s) WebP déjà à jour")
+        encode_dests = stale_encodes
+
+        # The destination folders are independent and transfer releases the GIL
+        # inside sendfile/read/write, so copies overlap instead of queueing.
+        # Logs are printed from the main thread to keep output deterministic.
+        if jobs or encode_dests:
+            encode_set = set(encode_dests)
+            with ThreadPoolExecutor(max_workers=min(8, len(jobs) + len(encode_dests))) as pool:
+                transfers = {
+                    pool.submit(transfer, src, dst): (label, src.name, dst)
+                    for label, src, dst in jobs
+                }
+                # Encodes whose original is already in place start right away;
+                # the others wait for their transfer so the bytes exist at dst.
+                encode_futures = {
+                    pool.submit(_encode_webp, dst, dst): dst.stem
+                    for dst in encode_dests if dst not in pending_dsts
+                }
+                for future in as_completed(transfers):
+                    future.result()  # surface copy errors
+                    label, name, dst = transfers[future]
+                    logger.debug("%s: %s", label, name)
+                    if dst in encode_set:
+                        encode_futures[pool.submit(_encode_webp, dst, dst)] = dst.stem
+                for future in as_completed(encode_futures):
+                    result = future.result()  # surface encode errors
+                    if result:
+                        self.srcsets[encode_futures[future]] = result
+                    logger.debug("🖼 WebP: %s", encode_futures[future])
+
+        return structure
+
+    def generate_assets_config_json(self):
+        """Génère politikcred-assets-config.json pour le front."""
+        logger.info("\n⚙️ GÉNÉRATION CONFIG JSON")
+        logger.info("=" * 50)
+
+        site_config = {
+            "politikcred_assets": {
+                "brand": {
+                    "name": "POLITIKCRED",
+                    "baseline": "Il est crédible lauiss ?",
+                    "style": "Street Science + Family Guy cartoon"
+                },
+                "hero_section": {
+                    "background_video": "/assets/backgrounds/animated-hemi.mp4",
+                    "fallback_image": "/assets/backgrounds/hemicycle.png",
+                    "title": "Évaluez la crédibilité de vos représentants",
+                    "cta": "Il est crédible lauiss ?",
+                    "loop": True,
+                    "autoplay": True,
+                    "muted": True
+                },
+                "featured_politicians": {
+                    "layout": "side_by_side",
+                    "videos": [
+                        {
+                            "file": "/assets/animations/lecornu.mp4",
+                            "politician": "Sébastien Lecornu",
+                            "position": "left",
+                            "poster": "/assets/politicians/lecornu.png"
+                        },
+                        {
+                            "file": "/assets/animations/lepen.mp4",
+                            "politician": "Marine Le Pen",
+                            "position": "right",
+                            "poster": "/assets/politicians/lepen.jpeg"
+                        }
+                    ],
+                    "sync_animation": True
+                },
+                "politicians_gallery": {
+                    "layout": "grid",
+                    "politicians": [
+                        {
+                            "name": "Élisabeth Borne",
+                            "image": "/assets/politicians/borne.png",
+                            "credibility_score": 88,
+                            "credibility_label": "Il assure lauiss !",
+                            "party": "Renaissance",
+                            "card_color": "#1E3A8A"
+                        },
+                        {
+                            "name": "Sébastien Lecornu",
+                            "image": "/assets/politicians/lecornu.png",
+                            "credibility_score": 87,
+                            "credibility_label": "Il assure lauiss !",
+                            "party": "Renaissance",
+                            "card_color": "#1E3A8A"
+                        },
+                        {
+                            "name": "Éric Lombard",
+                            "image": "/assets/politicians/lombart.png",
+                            "credibility_score": 90,
+                            "credibility_label": "Il assure lauiss !",
+                            "party": "Divers gauche",
+                            "card_color": "#059669"
+                        }
+                    ]
+                },
+                "design_system": {
+                    "colors": {
+                        "bleu_republique": "#1E3A8A",
+                        "rouge_tricolore": "#DC2626",
+                        "blanc_casse": "#FAFAFA",
+                        "vert_assemblee": "#059669",
+                        "or_institutionnel": "#D97706",
+                        "bordeaux_serieux": "#7C2D12",
+                        "rose_surprise": "#EC4899",
+                        "jaune_attention": "#EAB308"
+                    },
+                    "credibility_labels": {
+                        "high": "Il assure lauiss !",
+                        "medium": "Moyen lauiss...",
+                        "low": "Louche lauiss !"
+                    },
+                    "expressions": {
+                        "confident": "😎",
+                        "neutral": "😐",
+                        "skeptical": "🤨"
+                    }
+                },
+                "optimization": {
+                    "video_formats": ["mp4", "webm"],
+                    "image_formats": ["webp", "png", "jpg"],
+                    "lazy_loading": True,
+                    "responsive_images": True,
+                    "compression": "high_quality"
+                }
+            }
+        }
+
+        # Attach srcset strings for gallery portraits whose responsive WebP
+        # variants were emitted during this run, and only advertise the
+        # full-size variants actually on disk: browsers commit to the first
+        # supported <source> and do not fall back to <img> when it 404s, so
+        # a variant must never be referenced unless its file exists (no
+        # Pillow → no .webp, no AVIF plugin → no .avif).
+        for politician in site_config["politikcred_assets"]["politicians_gallery"]["politicians"]:
+            image = Path(politician["image"])
+            srcset = self.srcsets.get(image.stem)
+            if srcset:
+                politician["srcset"] = srcset
+            for fmt in ("webp", "avif"):
+                if (self.output_dir / image.parent.name / f"{image.stem}.{fmt}").exists():
+                    politician[f"image_{fmt}"] = str(image.with_suffix(f".{fmt}"))
+
+        config_path = self.output_dir / "politikcred-assets-config.json"
+        if orjson is not None:
+            # Single bytes buffer written in one shot, no Python-level indent walk
+            config_path.write_bytes(orjson.dumps(site_config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(config_path, 'w', encoding='utf-8') as f:
+                json.dump(site_config, f, indent=2, ensure_ascii=False)
+
+        logger.info(f"✅ Config générée: {config_path}")
+        return site_config
+
+    def generate_integration_components(self):
+        """Génère les composants JSX de référence pour l'intégration."""
+        logger.info("\n⚛️ GÉNÉRATION COMPOSANTS REACT")
+        logger.info("=" * 50)
+
+        components_dir = self.output_dir / "components"
+
+        _write_all([
+            (components_dir / "PolitikCredHero.jsx", HERO_JSX_BYTES),
+            (components_dir / "FeaturedPoliticians.jsx", FEATURED_JSX_BYTES),
+            (components_dir / "PoliticiansGallery.jsx", GALLERY_JSX_BYTES),
+        ])
+        logger.info("✅ PolitikCredHero.jsx")
+        logger.info("✅ FeaturedPoliticians.jsx")
+        logger.info("✅ PoliticiansGallery.jsx")
+
+    def generate_css_styles(self):
+        """Génère le CSS de la direction artistique."""
+        logger.info("\n🎨 GÉNÉRATION CSS")
+        logger.info("=" * 50)
+
+        css_path = self.output_dir / "politikcred-styles.css"
+        _write_all([(css_path, CSS_BYTES)])
+
+        logger.info(f"✅ CSS généré: {css_path}")
+
+    async def _run_pipeline(self):
+        """Overlap the I/O-bound copy phase with the CPU-bound generators.
+
+        Component/CSS writes only need the folder structure, so they run
+        concurrently with the asset transfers; the config JSON has to wait
+        for optimize_and_organize because it embeds the srcsets collected
+        while encoding.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.analyze_assets)
+        # Folders must exist before the concurrent writers touch them
+        self.create_assets_structure()
+        await asyncio.gather(
+            loop.run_in_executor(None, self.optimize_and_organize),
+            loop.run_in_executor(None, self.generate_integration_components),
+            loop.run_in_executor(None, self.generate_css_styles),
+        )
+        await loop.run_in_executor(None, self.generate_assets_config_json)
+
+    def run_complete_optimization(self):
+        """Pipeline complet: analyse → organisation → config → composants → CSS."""
+        logger.info("🔥 POLITIKCRED ASSETS OPTIMIZER")
+        logger.info("Il est crédible lauiss ? 🤔")
+        logger.info("=" * 60)
+
+        if not self.images_dir.exists():
+            logger.info(f"❌ Dossier source introuvable: {self.images_dir}")
+            return False
+
+        asyncio.run(self._run_pipeline())
+
+        logger.info("\n" + "=" * 60)
+        logger.info("🎉 OPTIMISATION TERMINÉE !")
+        logger.info(f"📁 Assets organisés dans: {self.output_dir}")
+        logger.info("🚀 Prêt pour l'intégration Next.js !")
+        return True
+
+
+if __name__ == "__main__":
+    flags = {a for a in sys.argv[1:] if a.startswith("--")}
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    _setup_logging(verbose="--verbose" in flags)
+    source = args[0] if args else None
+    optimizer = PolitikCredAssetsOptimizer(source, move_mode="--move" in flags)
+    success = optimizer.run_complete_optimization()
+    sys.exit(0 if success else 1)
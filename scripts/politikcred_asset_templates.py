@@ -0,0 +1,379 @@
+"""Generated-asset templates for the POLITIKCRED optimizer.
+
+The JSX components and the CSS are multi-KB literals; keeping them here as
+module-level bytes means they are encoded to UTF-8 exactly once at import
+(and shared across forked workers) instead of being rebuilt on every
+run_complete_optimization call.
+"""
+
+from typing import Final
+
+HERO_JSX_BYTES: Final[bytes] = '''import React from 'react';
+
+const PolitikCredHero = () => {
+  return (
+    <section className="relative h-screen w-full overflow-hidden">
+      {/* Background Video */}
+      <video
+        className="absolute inset-0 w-full h-full object-cover"
+        autoPlay
+        muted
+        loop
+        playsInline
+        poster="/assets/backgrounds/hemicycle.png"
+      >
+        <source src="/assets/backgrounds/animated-hemi.mp4" type="video/mp4" />
+        {/* Fallback image */}
+        <img
+          src="/assets/backgrounds/hemicycle.png"
+          alt="Hémicycle"
+          className="w-full h-full object-cover"
+        />
+      </video>
+
+      {/* Overlay */}
+      <div className="absolute inset-0 bg-black bg-opacity-40" />
+
+      {/* Content */}
+      <div className="relative z-10 flex items-center justify-center h-full text-center text-white">
+        <div className="max-w-4xl px-4">
+          <h1 className="text-5xl md:text-7xl font-bold mb-6">
+            🔥 POLITIKCRED
+          </h1>
+          <h2 className="text-2xl md:text-4xl font-semibold mb-8">
+            Évaluez la crédibilité de vos représentants
+          </h2>
+          <button className="bg-[#DC2626] hover:bg-[#B91C1C] text-white text-xl md:text-2xl px-8 py-4 rounded-lg font-bold transition-colors">
+            Il est crédible lauiss ? 🤔
+          </button>
+        </div>
+      </div>
+    </section>
+  );
+};
+
+export default PolitikCredHero;'''.encode("utf-8")
+
+FEATURED_JSX_BYTES: Final[bytes] = '''import React from 'react';
+
+const FeaturedPoliticians = () => {
+  return (
+    <section className="py-16 bg-[#FAFAFA]">
+      <div className="container mx-auto px-4">
+        <h2 className="text-4xl font-bold text-center mb-12 text-[#1E3A8A]">
+          Qui dit vrai lauiss ? 🎯
+        </h2>
+
+        <div className="grid md:grid-cols-2 gap-8 max-w-6xl mx-auto">
+          {/* Lecornu Video */}
+          <div className="bg-white rounded-lg shadow-lg overflow-hidden">
+            <video
+              className="w-full h-64 object-cover"
+              controls
+              poster="/assets/politicians/lecornu.png"
+            >
+              <source src="/assets/animations/lecornu.mp4" type="video/mp4" />
+            </video>
+            <div className="p-6">
+              <h3 className="text-xl font-bold text-[#1E3A8A]">Sébastien Lecornu</h3>
+              <p className="text-gray-600">Ministre des Armées</p>
+              <div className="mt-4 flex items-center justify-between">
+                <span className="text-2xl">🏆</span>
+                <span className="font-bold text-[#059669]">Déjà stressé lauiss !</span>
+                <span className="text-xl font-bold">??/100</span>
+              </div>
+            </div>
+          </div>
+
+          {/* Le Pen Video */}
+          <div className="bg-white rounded-lg shadow-lg overflow-hidden">
+            <video
+              className="w-full h-64 object-cover"
+              controls
+              poster="/assets/politicians/lepen.jpeg"
+            >
+              <source src="/assets/animations/lepen.mp4" type="video/mp4" />
+            </video>
+            <div className="p-6">
+              <h3 className="text-xl font-bold text-[#7C2D12]">Marine Le Pen</h3>
+              <p className="text-gray-600">Députée RN</p>
+              <div className="mt-4 flex items-center justify-between">
+                <span className="text-2xl">⚖️</span>
+                <span className="font-bold text-[#D97706]">Moyen la celle...</span>
+                <span className="text-xl font-bold">?? /100</span>
+              </div>
+            </div>
+          </div>
+        </div>
+      </div>
+    </section>
+  );
+};
+
+export default FeaturedPoliticians;'''.encode("utf-8")
+
+GALLERY_JSX_BYTES: Final[bytes] = '''import React from 'react';
+
+const PoliticiansGallery = ({ politicians }) => {
+  return (
+    <section className="py-16 bg-white">
+      <div className="container mx-auto px-4">
+        <h2 className="text-4xl font-bold text-center mb-12 text-[#1E3A8A]">
+          Le Palmarès POLITIKCRED 🏆
+        </h2>
+
+        <div className="grid md:grid-cols-3 lg:grid-cols-4 gap-6">
+          {politicians.map((politician, index) => (
+            <div
+              key={index}
+              className="bg-white rounded-lg shadow-lg overflow-hidden border-l-4 hover:shadow-xl transition-shadow"
+              style={{ borderColor: politician.card_color }}
+            >
+              {/* Seules les variantes réellement encodées sont annoncées
+                  (image_avif/image_webp dans la config): un navigateur
+                  retient la première <source> au type supporté et ne
+                  retombe pas sur <img> quand elle répond 404. */}
+              <picture>
+                {politician.image_avif && (
+                  <source srcSet={politician.image_avif} type="image/avif" />
+                )}
+                {politician.image_webp && (
+                  <source srcSet={politician.image_webp} type="image/webp" />
+                )}
+                <img
+                  src={politician.image}
+                  alt={politician.name}
+                  className="w-full h-48 object-cover"
+                />
+              </picture>
+              <div className="p-4">
+                <h3 className="font-bold text-lg mb-2">{politician.name}</h3>
+                <p className="text-sm text-gray-600 mb-3">{politician.party}</p>
+                <div className="flex items-center justify-between">
+                  <span className="text-lg">
+                    {politician.credibility_score >= 80 ? '🏆' :
+                     politician.credibility_score >= 60 ? '⚖️' : '⚠️'}
+                  </span>
+                  <span className="text-sm font-bold" style={{ color: politician.card_color }}>
+                    {politician.credibility_label}
+                  </span>
+                  <span className="font-bold text-lg">
+                    {politician.credibility_score}/100
+                  </span>
+                </div>
+              </div>
+            </div>
+          ))}
+        </div>
+      </div>
+    </section>
+  );
+};
+
+export default PoliticiansGallery;'''.encode("utf-8")
+
+CSS_BYTES: Final[bytes] = '''/* 🔥 POLITIKCRED - Direction Artistique CSS */
+/* "Il est crédible lauiss ?" - Styles street science ! */
+
+:root {
+  /* Couleurs POLITIKCRED Direction Artistique */
+  --bleu-republique: #1E3A8A;
+  --rouge-tricolore: #DC2626;
+  --blanc-casse: #FAFAFA;
+  --vert-assemblee: #059669;
+  --or-institutionnel: #D97706;
+  --bordeaux-serieux: #7C2D12;
+  --rose-surprise: #EC4899;
+  --jaune-attention: #EAB308;
+}
+
+/* Hero Section */
+.politikcred-hero {
+  position: relative;
+  height: 100vh;
+  overflow: hidden;
+}
+
+.politikcred-hero video {
+  position: absolute;
+  top: 0;
+  left: 0;
+  width: 100%;
+  height: 100%;
+  object-fit: cover;
+  z-index: -1;
+}
+
+.politikcred-overlay {
+  position: absolute;
+  top: 0;
+  left: 0;
+  width: 100%;
+  height: 100%;
+  background: rgba(0, 0, 0, 0.4);
+  z-index: 1;
+}
+
+.politikcred-content {
+  position: relative;
+  z-index: 2;
+  display: flex;
+  align-items: center;
+  justify-content: center;
+  height: 100%;
+  color: white;
+  text-align: center;
+}
+
+/* Cards Politiciens */
+.politician-card {
+  background: white;
+  border-radius: 12px;
+  box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
+  overflow: hidden;
+  transition: all 0.3s ease;
+  border-left: 4px solid var(--bleu-republique);
+}
+
+.politician-card:hover {
+  transform: translateY(-4px);
+  box-shadow: 0 8px 24px rgba(0, 0, 0, 0.15);
+}
+
+.politician-card.confident {
+  border-left-color: var(--vert-assemblee);
+}
+
+.politician-card.neutral {
+  border-left-color: var(--or-institutionnel);
+}
+
+.politician-card.skeptical {
+  border-left-color: var(--rouge-tricolore);
+}
+
+/* Credibility Badges */
+.credibility-badge {
+  display: inline-flex;
+  align-items: center;
+  gap: 8px;
+  padding: 4px 12px;
+  border-radius: 20px;
+  font-weight: bold;
+  font-size: 14px;
+}
+
+.credibility-high {
+  background: var(--vert-assemblee);
+  color: white;
+}
+
+.credibility-medium {
+  background: var(--or-institutionnel);
+  color: white;
+}
+
+.credibility-low {
+  background: var(--rouge-tricolore);
+  color: white;
+}
+
+/* Animations */
+@keyframes fadeInUp {
+  from {
+    opacity: 0;
+    transform: translateY(30px);
+  }
+  to {
+    opacity: 1;
+    transform: translateY(0);
+  }
+}
+
+.animate-fade-in-up {
+  animation: fadeInUp 0.6s ease-out;
+}
+
+/* Responsive Video */
+.responsive-video {
+  position: relative;
+  width: 100%;
+  height: 0;
+  padding-bottom: 56.25%; /* 16:9 ratio */
+}
+
+.responsive-video video {
+  position: absolute;
+  top: 0;
+  left: 0;
+  width: 100%;
+  height: 100%;
+  object-fit: cover;
+}
+
+/* Typography */
+.politikcred-title {
+  font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
+  font-weight: 900;
+  color: var(--bleu-republique);
+}
+
+.politikcred-baseline {
+  font-family: 'Inter', sans-serif;
+  font-weight: 600;
+  color: var(--rouge-tricolore);
+}
+
+/* Buttons */
+.btn-politikcred {
+  background: var(--rouge-tricolore);
+  color: white;
+  padding: 12px 24px;
+  border-radius: 8px;
+  font-weight: bold;
+  border: none;
+  cursor: pointer;
+  transition: all 0.3s ease;
+}
+
+.btn-politikcred:hover {
+  background: var(--bordeaux-serieux);
+  transform: translateY(-2px);
+  box-shadow: 0 4px 12px rgba(220, 38, 38, 0.3);
+}
+
+/* Grid Layout */
+.politicians-grid {
+  display: grid;
+  grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
+  gap: 24px;
+  padding: 24px;
+}
+
+/* Featured Section */
+.featured-politicians {
+  display: grid;
+  grid-template-columns: 1fr 1fr;
+  gap: 32px;
+  max-width: 1200px;
+  margin: 0 auto;
+}
+
+@media (max-width: 768px) {
+  .featured-politicians {
+    grid-template-columns: 1fr;
+    gap: 24px;
+  }
+}
+
+/* Loading States */
+.loading-skeleton {
+  background: linear-gradient(90deg, #f0f0f0 25%, #e0e0e0 50%, #f0f0f0 75%);
+  background-size: 200% 100%;
+  animation: loading 1.5s infinite;
+}
+
+@keyframes loading {
+  0% { background-position: 200% 0; }
+  100% { background-position: -200% 0; }
+}'''.encode("utf-8")
@@ -0,0 +1,891 @@
+#!/usr/bin/env python3
+"""
+🇫🇷 Politik Cred' - Population de la base politiciens
+Récupère les élus depuis les sources officielles et les insère dans Supabase:
+  - Députés: open data Assemblée Nationale (acteurs + mandats)
+  - Sénateurs: ODSEN_GENERAL.csv (senat.fr)
+  - Maires des principales villes: Répertoire National des Élus (data.gouv.fr)
+  - Ministres du gouvernement Bayrou (liste maintenue à la main)
+
+Usage:
+    python3 scripts/populate_politicians_db.py
+
+Dépendances: pip install supabase pandas requests python-dotenv
+Accélérateurs optionnels: pip install ijson orjson polars pyarrow psycopg
+  (streaming du JSON AN, décodage JSON rapide, parsing CSV parallèle, COPY)
+Variables requises dans .env.local: NEXT_PUBLIC_SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY
+"""
+
+import csv
+import json
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dotenv import load_dotenv
+from supabase import create_client
+
+try:
+    import psycopg  # chemin COPY direct, optionnel
+except ImportError:
+    psycopg = None
+
+try:
+    import ijson  # parsing JSON en flux, optionnel
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # décodage JSON rapide, optionnel
+except ImportError:
+    orjson = None
+
+try:
+    import polars as pl  # lecture CSV parallèle avec pushdown, optionnel
+except ImportError:
+    pl = None
+
+try:
+    import pyarrow as pa  # lecture CSV multi-threads, optionnel
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+load_dotenv(Path(__file__).resolve().parent.parent / ".env.local")
+
+DEPUTES_URL = "https://data.assemblee-nationale.fr/static/openData/repository/17/amo/tous_acteurs_mandats/AMO30_tous_acteurs_tous_mandats_tous_organes.json"
+SENATEURS_URL = "https://www.senat.fr/fichiers/csv/ODSEN_GENERAL.csv"
+MAIRES_URL = "https://www.data.gouv.fr/fr/datasets/r/2876a346-d50c-4911-934e-19ee07b0e503"
+
+# Cache disque des téléchargements (revalidé par ETag/If-Modified-Since:
+# une relance sans changement côté serveur ne retransfère rien).
+CACHE_DIR = Path.home() / ".cache" / "politik-cred"
+
+# Seules les colonnes réellement consommées sont parsées (le RNE complet
+# dépasse largement la dizaine de colonnes utiles).
+MAIRES_USECOLS = [
+    "Libellé de la commune", "Prénom de l'élu", "Nom de l'élu",
+    "Libellé de la nuance", "Libellé du département",
+    "Date de naissance", "Code sexe",
+]
+
+# Communes ciblées pour les maires (noms RNE en majuscules). frozenset:
+# le test d'appartenance est un hash, pas un parcours de liste. Les trois
+# lecteurs ne font que majusculiser la colonne, sans désaccentuer: les
+# graphies accentuées du RNE ("NÎMES", "SAINT-ÉTIENNE") figurent donc ici
+# aux côtés des formes ASCII.
+_GRANDES_VILLES = frozenset({
+    "PARIS", "MARSEILLE", "LYON", "TOULOUSE", "NICE",
+    "NANTES", "MONTPELLIER", "STRASBOURG", "BORDEAUX", "LILLE",
+    "RENNES", "REIMS", "TOULON", "SAINT-ETIENNE", "SAINT-ÉTIENNE",
+    "LE HAVRE", "GRENOBLE", "DIJON", "ANGERS", "NIMES", "NÎMES",
+    "CLERMONT-FERRAND",
+})
+
+# Gouvernement Bayrou: liste maintenue à la main, figée en tuple de module
+# pour ne pas reconstruire ces dicts à chaque appel.
+_MINISTRES_BAYROU = (
+    {"name": "François Bayrou", "first_name": "François", "last_name": "Bayrou",
+     "party": "MoDem", "position": "Premier ministre",
+     "political_orientation": "center"},
+    {"name": "Élisabeth Borne", "first_name": "Élisabeth", "last_name": "Borne",
+     "party": "Renaissance", "position": "Ministre de l'Éducation nationale",
+     "political_orientation": "center"},
+    {"name": "Bruno Retailleau", "first_name": "Bruno", "last_name": "Retailleau",
+     "party": "Les Républicains", "position": "Ministre de l'Intérieur",
+     "political_orientation": "right"},
+    {"name": "Éric Lombard", "first_name": "Éric", "last_name": "Lombard",
+     "party": "Divers gauche", "position": "Ministre de l'Économie et des Finances",
+     "political_orientation": "center-left"},
+    {"name": "Sébastien Lecornu", "first_name": "Sébastien", "last_name": "Lecornu",
+     "party": "Renaissance", "position": "Ministre des Armées",
+     "political_orientation": "center"},
+    {"name": "Rachida Dati", "first_name": "Rachida", "last_name": "Dati",
+     "party": "Les Républicains", "position": "Ministre de la Culture",
+     "political_orientation": "right"},
+    {"name": "Jean-Noël Barrot", "first_name": "Jean-Noël", "last_name": "Barrot",
+     "party": "MoDem", "position": "Ministre de l'Europe et des Affaires étrangères",
+     "political_orientation": "center"},
+    {"name": "Gérald Darmanin", "first_name": "Gérald", "last_name": "Darmanin",
+     "party": "Renaissance", "position": "Ministre de la Justice",
+     "political_orientation": "center-right"},
+    {"name": "Catherine Vautrin", "first_name": "Catherine", "last_name": "Vautrin",
+     "party": "Renaissance", "position": "Ministre du Travail, de la Santé et des Solidarités",
+     "political_orientation": "center-right"},
+    {"name": "Agnès Pannier-Runacher", "first_name": "Agnès", "last_name": "Pannier-Runacher",
+     "party": "Renaissance", "position": "Ministre de la Transition écologique",
+     "political_orientation": "center"},
+    {"name": "Manuel Valls", "first_name": "Manuel", "last_name": "Valls",
+     "party": "Divers gauche", "position": "Ministre des Outre-mer",
+     "political_orientation": "center-left"},
+)
+
+# Parti/groupe (normalisé en minuscules) -> orientation politique grossière.
+# Constante de module: le dict n'est construit qu'une fois, la regex couvre
+# le repli "le mot-clé apparaît dans le libellé".
+_ORIENTATIONS = {
+    "la france insoumise": "left",
+    "lfi": "left",
+    "parti communiste": "left",
+    "pcf": "left",
+    "parti socialiste": "center-left",
+    "socialiste": "center-left",
+    "divers gauche": "center-left",
+    "écologiste": "center-left",
+    "eelv": "center-left",
+    "renaissance": "center",
+    "modem": "center",
+    "démocrate": "center",
+    "horizons": "center-right",
+    "udi": "center-right",
+    "les républicains": "right",
+    "républicains": "right",
+    "divers droite": "right",
+    "rassemblement national": "right",
+    "reconquête": "right",
+}
+_ORIENTATION_ALTERNATION = "|".join(map(re.escape, _ORIENTATIONS))
+# Un groupe par mot-clé: match.lastindex désigne directement l'orientation
+# dans le tuple parallèle, sans second sondage du dict.
+_ORIENTATION_PATTERN = re.compile(
+    "|".join(f"({re.escape(keyword)})" for keyword in _ORIENTATIONS)
+)
+_ORIENTATION_VALUES = tuple(_ORIENTATIONS.values())
+
+
+@lru_cache(maxsize=256)
+def _orientation_for(party_lower):
+    """Orientation pour un libellé déjà minusculisé (cardinalité faible:
+    quelques dizaines de groupes pour des milliers d'élus, d'où le cache)."""
+    orientation = _ORIENTATIONS.get(party_lower)
+    if orientation is not None:
+        return orientation
+    match = _ORIENTATION_PATTERN.search(party_lower)
+    return _ORIENTATION_VALUES[match.lastindex - 1] if match else "center"
+
+
+# Dates de naissance Sénat/RNE au format français JJ/MM/AAAA; la colonne
+# birth_date est de type DATE et Postgres (DateStyle ISO, MDY) rejette ou
+# inverse ces littéraux — on les réécrit en ISO avant insertion.
+_FR_DATE_PATTERN = re.compile(r"^(\d{2})/(\d{2})/(\d{4})$")
+
+
+def _iso_birth_date(value):
+    """'14/09/1949' → '1949-09-14'; valeur déjà ISO inchangée, vide → None."""
+    if not value:
+        return None
+    match = _FR_DATE_PATTERN.match(value)
+    if match:
+        day, month, year = match.groups()
+        return f"{year}-{month}-{day}"
+    return value
+
+
+class PoliticiansDatabasePopulator:
+    """Collecte multi-sources des élus français et insertion Supabase."""
+
+    def __init__(self):
+        supabase_url = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
+        supabase_key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+        if not supabase_url or not supabase_key:
+            print("❌ Variables Supabase manquantes dans .env.local")
+            sys.exit(1)
+        self.supabase = create_client(supabase_url, supabase_key)
+
+        # Session partagée: keep-alive (une seule poignée de main TLS par
+        # hôte) et corps compressés pour tous les téléchargements.
+        self.session = requests.Session()
+        self.session.headers.update({"Accept-Encoding": "gzip, deflate"})
+
+        # Les échecs transitoires (rate-limit, passerelle) se rejouent dans
+        # l'adaptateur avec backoff, sans remonter jusqu'au code appelant.
+        retry = Retry(
+            total=5, backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=["GET", "HEAD"],
+        )
+        # Pool dimensionné sur nos usages: un hôte par source (4 fetchers),
+        # jusqu'à 8 connexions gardées vivantes pour les téléchargements.
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    # ------------------------------------------------------------------
+    # Fetchers
+    # ------------------------------------------------------------------
+
+    def _run_timestamp(self):
+        """Timestamp unique partagé par toutes les lignes d'un même run."""
+        if not hasattr(self, "_now_iso"):
+            self._now_iso = datetime.now(timezone.utc).isoformat()
+        return self._now_iso
+
+    def _cached_get(self, url, cache_name):
+        """Télécharge url vers le cache disque, revalidé par ETag/Last-Modified.
+
+        Retourne le chemin du fichier en cache (réponse 304 = aucun transfert).
+        """
+        cache_path = CACHE_DIR / cache_name
+        meta_path = CACHE_DIR / (cache_name + ".meta.json")
+
+        headers = {}
+        if cache_path.exists() and meta_path.exists():
+            try:
+                meta = json.loads(meta_path.read_text())
+            except ValueError:
+                meta = {}
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = self.session.get(url, headers=headers, stream=True, timeout=120)
+        if response.status_code == 304:
+            print(f"💾 {cache_name}: inchangé côté serveur, lecture du cache")
+            return cache_path
+        response.raise_for_status()
+
+        # Écriture en flux: le corps (des dizaines de Mo pour le RNE) ne
+        # transite jamais entier par la mémoire.
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "wb") as fh:
+            for block in response.iter_content(chunk_size=1 << 20):
+                fh.write(block)
+        meta_path.write_text(json.dumps({
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }))
+        return cache_path
+
+    def _iter_acteurs(self):
+        """Itère sur les acteurs AN, en flux via ijson quand disponible.
+
+        Le document AMO30 pèse plusieurs Mo très imbriqués: le streaming
+        garde en mémoire un acteur à la fois au lieu de l'arbre complet.
+        """
+        if ijson is not None:
+            response = self.session.get(DEPUTES_URL, stream=True, timeout=60)
+            response.raise_for_status()
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, "export.acteurs.acteur.item")
+        else:
+            response = self.session.get(DEPUTES_URL, timeout=60)
+            response.raise_for_status()
+            # orjson décode ce document multi-Mo nettement plus vite que le
+            # json stdlib qu'utilise response.json().
+            if orjson is not None:
+                data = orjson.loads(response.content)
+            else:
+                data = response.json()
+            yield from data.get("export", {}).get("acteurs", {}).get("acteur", [])
+
+    def fetch_deputes(self):
+        """Députés actifs depuis l'open data de l'Assemblée Nationale."""
+        print("🏛️ Récupération des députés...")
+        deputies = []
+        append = deputies.append
+
+        # Un seul timestamp pour tout l'import: deux appels datetime.now()
+        # par ligne ne servent à rien.
+        now_iso = self._run_timestamp()
+
+        try:
+            for acteur in self._iter_acteurs():
+                try:
+                    etat_civil = acteur.get("etatCivil", {})
+                    ident = etat_civil.get("ident", {})
+                    prenom = ident.get("prenom", "")
+                    nom = ident.get("nom", "")
+                    if not prenom or not nom:
+                        continue
+
+                    mandats = acteur.get("mandats", {}).get("mandat", [])
+                    if isinstance(mandats, dict):
+                        mandats = [mandats]
+                    mandat = self._find_depute_mandat(mandats)
+                    if mandat is None:
+                        continue
+
+                    naissance = etat_civil.get("infoNaissance", {})
+
+                    # Chaque valeur dérivée est calculée une seule fois:
+                    # _extract_party_from_mandate était appelé deux fois
+                    # par député (party + orientation). sys.intern partage
+                    # les quelques libellés de groupe entre tous les rangs.
+                    party = sys.intern(self._extract_party_from_mandate(mandat))
+
+                    append({
+                        "name": f"{prenom} {nom}".strip(),
+                        "first_name": prenom,
+                        "last_name": nom,
+                        "party": party,
+                        "position": "Député",
+                        "constituency": mandat.get("election", {}).get("lieu", {}).get("departement", ""),
+                        "birth_date": naissance.get("dateNais") or None,
+                        "gender": "M" if ident.get("civ") == "M." else "F",
+                        "political_orientation": self._determine_orientation(party),
+                        "verification_status": "verified",
+                        "is_active": True,
+                        "created_at": now_iso,
+                        "updated_at": now_iso,
+                    })
+                except Exception as e:
+                    print(f"⚠️ Député ignoré: {e}")
+                    continue
+        except Exception as e:
+            print(f"⚠️ Échec du téléchargement des députés: {e}")
+            return deputies
+
+        print(f"✅ {len(deputies)} députés récupérés")
+        return deputies
+
+    def fetch_senateurs(self):
+        """Sénateurs en exercice depuis le fichier open data du Sénat."""
+        print("🏛️ Récupération des sénateurs...")
+        senators = []
+
+        try:
+            csv_path = self._cached_get(SENATEURS_URL, "ODSEN_GENERAL.csv")
+        except Exception as e:
+            print(f"⚠️ Échec du téléchargement des sénateurs: {e}")
+            return senators
+
+        # Quelques centaines de lignes: csv.DictReader suffit largement,
+        # sans payer l'inférence de schéma ni les allocations pandas.
+        # Champs identiques pour toutes les lignes, construits une seule fois
+        # et fusionnés par dépaquetage (même motif que pour les ministres).
+        common = {
+            "position": "Sénateur",
+            "verification_status": "verified",
+            "is_active": True,
+            "created_at": self._run_timestamp(),
+            "updated_at": self._run_timestamp(),
+        }
+        append = senators.append
+        with open(csv_path, encoding="utf-8", newline="") as fh:
+            for row in csv.DictReader(fh, delimiter=";"):
+                # Mandats en cours uniquement
+                if (row.get("Date de fin de mandat") or "").strip():
+                    continue
+
+                prenom = (row.get("Prénom") or "").strip()
+                nom = (row.get("Nom usage") or "").strip() or (row.get("Nom") or "").strip()
+                if not prenom or not nom:
+                    continue
+
+                party = sys.intern((row.get("Groupe politique") or "").strip())
+                append({
+                    "name": f"{prenom} {nom}",
+                    "first_name": prenom,
+                    "last_name": nom,
+                    "party": party,
+                    "constituency": (row.get("Département") or "").strip(),
+                    "birth_date": _iso_birth_date((row.get("Date de naissance") or "").strip()),
+                    "gender": "M" if (row.get("Civilité") or "").strip() == "M." else "F",
+                    "political_orientation": self._determine_orientation(party),
+                    **common,
+                })
+
+        print(f"✅ {len(senators)} sénateurs récupérés")
+        return senators
+
+    def _read_maires_polars(self, csv_path):
+        """Lecture RNE via polars: scan paresseux, filtre poussé dans le
+        parseur multi-threads, conversion pandas des ~20 lignes retenues."""
+        ville_norm = (
+            pl.col("Libellé de la commune")
+            .cast(pl.Utf8).fill_null("")
+            .str.strip_chars().str.to_uppercase()
+        )
+        frame = (
+            pl.scan_csv(
+                csv_path, separator=";",
+                encoding="utf8-lossy", infer_schema=False,
+            )
+            .select([pl.col(column) for column in MAIRES_USECOLS])
+            .with_columns(ville_norm.alias("_ville"))
+            .filter(pl.col("_ville").is_in(list(_GRANDES_VILLES)))
+            .collect()
+        )
+        return frame.to_pandas().astype("string")
+
+    def _read_maires_pyarrow(self, csv_path):
+        """Repli pyarrow: parsing CSV multi-threads des seules colonnes
+        utiles, filtre vectorisé sur la commune avant conversion pandas."""
+        table = pacsv.read_csv(
+            csv_path,
+            parse_options=pacsv.ParseOptions(delimiter=";"),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=MAIRES_USECOLS, column_types={
+                    column: pa.string() for column in MAIRES_USECOLS
+                },
+            ),
+        )
+        ville_norm = pc.utf8_upper(
+            pc.utf8_trim_whitespace(
+                pc.fill_null(table["Libellé de la commune"], "")
+            )
+        )
+        table = table.append_column("_ville", ville_norm).filter(
+            pc.is_in(ville_norm, value_set=pa.array(_GRANDES_VILLES))
+        )
+        return table.to_pandas().astype("string")
+
+    def _read_maires_pandas(self, csv_path):
+        """Repli pandas: lecture par tranches de 50k lignes, filtre par
+        tranche — la mémoire de pointe reste celle d'une seule tranche."""
+        matched = []
+        reader = pd.read_csv(
+            csv_path, sep=";", encoding="utf-8",
+            usecols=MAIRES_USECOLS, dtype="string", chunksize=50_000,
+        )
+        for chunk in reader:
+            ville_norm = (
+                chunk["Libellé de la commune"]
+                .fillna("").astype(str).str.strip().str.upper()
+            )
+            mask = ville_norm.isin(_GRANDES_VILLES)
+            if mask.any():
+                kept = chunk.loc[mask].copy()
+                # On conserve le nom normalisé calculé pour le filtre:
+                # inutile de le recalculer après la concaténation.
+                kept["_ville"] = ville_norm[mask]
+                matched.append(kept)
+        if not matched:
+            return None
+        return pd.concat(matched, ignore_index=True)
+
+    def fetch_maires_principales_villes(self):
+        """Maires des grandes villes depuis le Répertoire National des Élus."""
+        print("🏙️ Récupération des maires des principales villes...")
+        mayors = []
+
+        # Le RNE complet pèse plusieurs dizaines de Mo pour ~20 lignes utiles
+        try:
+            csv_path = self._cached_get(MAIRES_URL, "rne-maires.csv")
+            if pl is not None:
+                df = self._read_maires_polars(csv_path)
+            elif pa is not None:
+                df = self._read_maires_pyarrow(csv_path)
+            else:
+                df = self._read_maires_pandas(csv_path)
+        except Exception as e:
+            print(f"⚠️ Échec du téléchargement des maires: {e}")
+            return mayors
+
+        if df is None or df.empty:
+            print("✅ 0 maires récupérés")
+            return mayors
+
+        ville = df.pop("_ville")
+
+        now_iso = self._run_timestamp()
+        out = pd.DataFrame({
+            "first_name": df["Prénom de l'élu"].fillna("").astype(str).str.strip(),
+            "last_name": df["Nom de l'élu"].fillna("").astype(str).str.strip(),
+            "party": df["Libellé de la nuance"].fillna("").astype(str).str.strip(),
+            "position": "Maire de " + ville.str.title(),
+            "constituency": df["Libellé du département"].fillna("").astype(str).str.strip(),
+            "birth_date": df["Date de naissance"].fillna("").astype(str).str.strip()
+            .str.replace(_FR_DATE_PATTERN, r"\3-\2-\1", regex=True),
+            "gender": np.where(df["Code sexe"].fillna("").astype(str).str.strip().eq("M"), "M", "F"),
+        })
+        out = out[(out["first_name"] != "") & (out["last_name"] != "")]
+        out["name"] = out["first_name"].str.cat(out["last_name"], sep=" ")
+        out["political_orientation"] = self._orientation_series(out["party"])
+        # Équivalent vectorisé de sys.intern: les nuances et orientations se
+        # répètent, category ne stocke chaque libellé qu'une fois.
+        out["party"] = out["party"].astype("category")
+        out["political_orientation"] = out["political_orientation"].astype("category")
+        out["verification_status"] = "verified"
+        out["is_active"] = True
+        out["created_at"] = now_iso
+        out["updated_at"] = now_iso
+
+        mayors = self._records_from_frame(out)
+        print(f"✅ {len(mayors)} maires récupérés")
+        return mayors
+
+    def fetch_ministres_gouvernement_bayrou(self):
+        """Ministres principaux du gouvernement Bayrou (liste maintenue à la main)."""
+        print("🏛️ Ajout des ministres du gouvernement Bayrou...")
+
+        now_iso = self._run_timestamp()
+
+        # Un seul dict alloué par ministre: la fusion {**base, **common}
+        # évite la passe .update() sur un dict déjà construit.
+        common = {
+            "constituency": "France",
+            "birth_date": None,
+            "gender": None,
+            "verification_status": "verified",
+            "is_active": True,
+            "created_at": now_iso,
+            "updated_at": now_iso,
+        }
+        ministres = [{**base, **common} for base in _MINISTRES_BAYROU]
+
+        print(f"✅ {len(ministres)} ministres ajoutés")
+        return ministres
+
+    # ------------------------------------------------------------------
+    # Transformations
+    # ------------------------------------------------------------------
+
+    def _records_from_frame(self, out):
+        """Convertit un DataFrame normalisé en liste de dicts prêts à insérer."""
+        columns = [
+            "name", "first_name", "last_name", "party", "position",
+            "constituency", "birth_date", "gender", "political_orientation",
+            "verification_status", "is_active", "created_at", "updated_at",
+        ]
+        # La sélection de colonnes produit déjà une copie: assign() s'y
+        # greffe sans dupliquer le DataFrame une seconde fois.
+        out = out[columns].assign(birth_date=out["birth_date"].replace({"": None}))
+        return out.to_dict(orient="records")
+
+    def _find_depute_mandat(self, mandats):
+        """Retourne le mandat de député en cours, ou None."""
+        for mandat in mandats:
+            if mandat.get("typeOrgane") == "ASSEMBLEE" and not mandat.get("dateFin"):
+                return mandat
+        return None
+
+    def _extract_party_from_mandate(self, mandat):
+        """Extrait le groupe/parti d'un mandat AN."""
+        organes = mandat.get("organes", {}).get("organeRef", "")
+        if isinstance(organes, list):
+            organes = organes[0] if organes else ""
+        libelle = mandat.get("libelle") or mandat.get("infosQualite", {}).get("libQualite", "")
+        return (libelle or organes or "Sans étiquette").strip()
+
+    def _determine_orientation(self, party):
+        """Mappe un parti/groupe vers une orientation politique grossière."""
+        if not party:
+            return "center"
+        return _orientation_for(party.lower())
+
+    def _orientation_series(self, party):
+        """Version vectorisée de _determine_orientation pour une Series."""
+        # Un seul balayage C: str.extract trouve le mot-clé (un libellé
+        # exact se contient lui-même), map le traduit en orientation.
+        return (
+            party.str.lower()
+            .str.extract(f"({_ORIENTATION_ALTERNATION})", expand=False)
+            .map(_ORIENTATIONS)
+            .fillna("center")
+        )
+
+    # Tables de style au niveau classe: construites une fois, pas à chaque
+    # politicien. L'ordre des rôles compte ("premier ministre" avant
+    # "ministre"), la regex à groupes le préserve en une seule passe.
+    _ORIENT_COLORS = {
+        "left": "#DC2626",
+        "center-left": "#EC4899",
+        "center": "#D97706",
+        "center-right": "#3B82F6",
+        "right": "#1E3A8A",
+    }
+    _ROLE_EMOJIS = (
+        ("premier ministre", "🇫🇷"),
+        ("ministre", "🏛️"),
+        ("président", "🎖️"),
+        ("maire", "🏙️"),
+        ("député", "🗳️"),
+        ("sénateur", "⚖️"),
+    )
+    _ROLE_ALTERNATION = "|".join(re.escape(role) for role, _ in _ROLE_EMOJIS)
+    _ROLE_EMOJI_BY_KEYWORD = dict(_ROLE_EMOJIS)
+
+    def _clean_and_deduplicate(self, politicians, registry=None, registry_lock=None):
+        """Supprime les doublons (même prénom+nom) et les entrées invalides.
+
+        Avec registry/registry_lock, les clés retenues sont réclamées dans
+        un registre partagé entre sources: première source arrivée gagne,
+        comme quand la liste combinée était dédupliquée en une seule passe.
+        Sans registre, un élu à double casquette (Retailleau sénateur et
+        ministre, Borne députée et ministre...) partirait dans deux lots
+        concurrents et sa fiche finale dépendrait du lot écrit en dernier.
+        """
+        # Clé tuple (prénom, nom) normalisée + dict.setdefault: une seule
+        # passe, premier arrivé gagne, sans formatage de chaîne par ligne.
+        seen = {}
+        setdefault = seen.setdefault
+        for politician in politicians:
+            first = (politician.get("first_name") or "").strip().lower()
+            last = (politician.get("last_name") or "").strip().lower()
+            if first and last and politician.get("position"):
+                setdefault((first, last), politician)
+
+        if registry is None:
+            cleaned = list(seen.values())
+        else:
+            with registry_lock:
+                cleaned = [
+                    politician for key, politician in seen.items()
+                    if key not in registry
+                ]
+                registry.update(seen)
+        if not cleaned:
+            return cleaned
+
+        # Style vectorisé: les deux colonnes sont calculées en C pour tout
+        # le lot au lieu d'un appel _assign_visual_elements par politicien.
+        positions = pd.Series(
+            [politician.get("position") or "" for politician in cleaned]
+        )
+        # (?i) évite de minusculiser toute la colonne; seule la courte
+        # capture l'est avant le map.
+        emojis = (
+            positions.str.extract(f"(?i)({self._ROLE_ALTERNATION})", expand=False)
+            .str.lower()
+            .map(self._ROLE_EMOJI_BY_KEYWORD)
+            .fillna("👤")
+        )
+        colors = (
+            pd.Series([politician.get("political_orientation") for politician in cleaned])
+            .map(self._ORIENT_COLORS)
+            .fillna("#6B7280")
+        )
+        for politician, color, emoji in zip(cleaned, colors, emojis):
+            politician["card_color"] = color
+            politician["avatar_emoji"] = emoji
+
+        # Trier avant insertion regroupe les lignes voisines dans les index
+        # Postgres (orientation, nom): moins de pages de B-tree touchées
+        # par lot, et un ordre d'insertion déterministe entre les runs.
+        cleaned.sort(
+            key=lambda p: (p.get("political_orientation") or "", p.get("last_name") or "")
+        )
+        return cleaned
+
+    # ------------------------------------------------------------------
+    # Insertion
+    # ------------------------------------------------------------------
+
+    def insert_politicians_batch(self, politicians, batch_size=500, max_workers=8,
+                                 use_copy=False):
+        """Insère les politiciens par lots dans Supabase (lots concurrents).
+
+        Avec use_copy=True et DATABASE_URL défini, passe par COPY via psycopg
+        (chemin d'ingestion le plus rapide de Postgres) au lieu de PostgREST.
+        """
+        if use_copy:
+            copied = self._copy_politicians(politicians)
+            if copied is not None:
+                return copied
+
+        batches = [
+            politicians[i:i + batch_size]
+            for i in range(0, len(politicians), batch_size)
+        ]
+        if not batches:
+            return 0
+
+        # Chaque lot est une aller-retour PostgREST ~100 ms: les envoyer en
+        # concurrence recouvre la latence réseau. Au-delà de 8 workers le
+        # pool de connexions Supabase sature sans gain.
+        total_inserted = 0
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            futures = [
+                executor.submit(self._insert_one_batch, batch, number)
+                for number, batch in enumerate(batches, start=1)
+            ]
+            for future in as_completed(futures):
+                total_inserted += future.result()
+
+        return total_inserted
+
+    def _copy_politicians(self, politicians):
+        """Ingestion via COPY + upsert, ou None si psycopg/DATABASE_URL absent.
+
+        COPY ne sait pas résoudre les conflits: les lignes passent par une
+        table temporaire (COPY reste le chemin d'ingestion le plus rapide de
+        Postgres), puis un seul INSERT ... ON CONFLICT (first_name,
+        last_name) DO UPDATE les verse dans politicians — même sémantique
+        que l'upsert PostgREST, re-exécution idempotente comprise.
+        """
+        database_url = os.environ.get("DATABASE_URL")
+        if psycopg is None or not database_url or not politicians:
+            if politicians:
+                print("⚠️ COPY indisponible (psycopg ou DATABASE_URL manquant), repli sur upsert")
+            return None
+
+        columns = list(politicians[0].keys())
+        column_list = ", ".join(columns)
+        updates = ", ".join(
+            f"{column} = EXCLUDED.{column}"
+            for column in columns
+            if column not in ("first_name", "last_name")
+        )
+        with psycopg.connect(database_url) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "CREATE TEMP TABLE politicians_copy "
+                    "(LIKE politicians INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+                with cur.copy(
+                    f"COPY politicians_copy ({column_list}) FROM STDIN"
+                ) as copy:
+                    for row in politicians:
+                        copy.write_row([row.get(column) for column in columns])
+                # DISTINCT ON: un doublon résiduel dans le lot ferait
+                # échouer l'upsert entier ("cannot affect row a second time")
+                cur.execute(
+                    f"INSERT INTO politicians ({column_list}) "
+                    f"SELECT DISTINCT ON (first_name, last_name) {column_list} "
+                    "FROM politicians_copy "
+                    f"ON CONFLICT (first_name, last_name) DO UPDATE SET {updates}"
+                )
+        print(f"📦 {len(politicians)} politiciens chargés via COPY")
+        return len(politicians)
+
+    @staticmethod
+    def _is_validation_error(error):
+        """Vrai si l'erreur est un rejet de payload (400/422).
+
+        Comparaison exacte sur l'attribut code des APIError PostgREST:
+        chercher '400' dans le message classerait un timeout de 40000 ms
+        en rejet et enverrait le lot en bissection contre un serveur en
+        panne au lieu de le relancer.
+        """
+        return str(getattr(error, "code", "") or "") in {"400", "422"}
+
+    def _insert_one_batch(self, batch, batch_number, max_attempts=4):
+        """Upserte un lot, avec backoff exponentiel sur erreur transitoire."""
+        last_error = None
+        for attempt in range(max_attempts):
+            try:
+                # upsert rend les relances idempotentes (plus d'échecs de
+                # doublons), returning='minimal' divise la réponse par deux.
+                self.supabase.table("politicians").upsert(
+                    batch, on_conflict="first_name,last_name", returning="minimal"
+                ).execute()
+                return len(batch)
+            except Exception as e:
+                last_error = e
+                # On ne dort que sur échec transitoire: le chemin nominal
+                # reste une requête par lot sans pause. Un 429 attend plus
+                # longtemps qu'une erreur réseau ordinaire.
+                if not self._is_validation_error(e) and attempt < max_attempts - 1:
+                    delay = 2 ** attempt
+                    if "429" in str(getattr(e, "code", "") or "") or "429" in str(e):
+                        delay = max(delay, 5)
+                    time.sleep(delay)
+                    continue
+                print(f"⚠️ Échec du lot {batch_number}: {e}")
+                break
+
+        # Le repli n'a de sens que pour isoler des lignes invalides,
+        # pas pour un réseau en panne.
+        if last_error is not None and not self._is_validation_error(last_error):
+            print(f"⚠️ Lot {batch_number} abandonné après {max_attempts} tentatives")
+            return 0
+
+        # Rejet de payload: bissection du lot — chaque mauvaise ligne coûte
+        # O(log n) requêtes au lieu d'un aller-retour par ligne du lot.
+        return self._insert_with_bisect(batch)
+
+    def _insert_with_bisect(self, batch):
+        """Upserte batch; en cas de rejet, divise en deux jusqu'à la ligne."""
+        if not batch:
+            return 0
+        try:
+            self.supabase.table("politicians").upsert(
+                batch, on_conflict="first_name,last_name", returning="minimal"
+            ).execute()
+            return len(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                print(f"   ❌ {batch[0].get('name', 'Inconnu')}: {e}")
+                return 0
+            middle = len(batch) // 2
+            return (
+                self._insert_with_bisect(batch[:middle])
+                + self._insert_with_bisect(batch[middle:])
+            )
+
+    # ------------------------------------------------------------------
+    # Orchestration
+    # ------------------------------------------------------------------
+
+    def populate_database(self, use_copy=False):
+        """Pipeline complet: fetch (parallèle) → nettoyage → insertion."""
+        print("🇫🇷 POPULATION DE LA BASE POLITICIANS")
+        print("=" * 60)
+
+        # created_at/updated_at identiques pour tout l'import
+        self._now_iso = datetime.now(timezone.utc).isoformat()
+
+        fetchers = [
+            self.fetch_deputes,
+            self.fetch_senateurs,
+            self.fetch_maires_principales_villes,
+            self.fetch_ministres_gouvernement_bayrou,
+        ]
+
+        # Les téléchargements sont indépendants et purement I/O-bound: les
+        # lancer en parallèle ramène le temps d'attente au plus lent d'entre
+        # eux au lieu de leur somme. Chaque source terminée part aussitôt en
+        # insertion pendant que les autres téléchargent encore: la latence
+        # Supabase se cache derrière celle des APIs gouvernementales. Les
+        # doublons inter-sources sont réclamés dans un registre partagé
+        # avant soumission (première source terminée gagne): l'upsert sur
+        # (first_name, last_name) ne départage donc jamais deux lots
+        # concurrents portant le même élu.
+        total_fetched = 0
+        insert_futures = []
+        seen_keys = set()
+        seen_lock = threading.Lock()
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+            futures = {
+                executor.submit(fetcher): fetcher.__name__ for fetcher in fetchers
+            }
+            for future in as_completed(futures):
+                try:
+                    politicians = future.result()
+                except Exception as e:
+                    # Une source en panne ne doit pas faire perdre les autres
+                    print(f"⚠️ {futures[future]} a échoué: {e}")
+                    continue
+                total_fetched += len(politicians)
+                cleaned = self._clean_and_deduplicate(
+                    politicians, registry=seen_keys, registry_lock=seen_lock
+                )
+                if cleaned:
+                    insert_futures.append(
+                        executor.submit(
+                            self.insert_politicians_batch, cleaned,
+                            use_copy=use_copy,
+                        )
+                    )
+
+            inserted = sum(future.result() for future in insert_futures)
+
+        print(f"\n📊 {total_fetched} politiciens récupérés au total")
+
+        if not insert_futures:
+            print("❌ Aucun politicien à insérer")
+            return 0
+        print("\n" + "=" * 60)
+        print(f"🎉 {inserted} politiciens insérés dans Supabase")
+        return inserted
+
+
+if __name__ == "__main__":
+    populator = PoliticiansDatabasePopulator()
+    # --copy: ingestion COPY via psycopg quand DATABASE_URL est défini
+    populator.populate_database(use_copy="--copy" in sys.argv)
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+🎨 Politik Cred' - Liaison des assets visuels aux politiciens
+Relie les portraits et animations de public/assets (voir organize_assets.py)
+aux lignes de la table politicians dans Supabase:
+  - avatar_url: portrait cartoon (/assets/politicians/*.png)
+  - animation_url: vidéo d'animation (/assets/animations/*.mp4)
+  - highlight: mise en avant sur la page d'accueil
+
+Usage:
+    python3 scripts/update_politicians_assets.py
+
+Dépendances: pip install supabase python-dotenv
+Accélérateur optionnel: pip install orjson (décodage JSON de la config)
+Variables requises dans .env.local: NEXT_PUBLIC_SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY
+"""
+
+import json
+import os
+import sys
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+import httpx
+from dotenv import load_dotenv
+from postgrest.exceptions import APIError
+from supabase import create_client
+from supabase.lib.client_options import SyncClientOptions
+
+try:
+    import orjson  # décodage JSON rapide, optionnel
+except ImportError:
+    orjson = None
+
+load_dotenv(Path(__file__).resolve().parent.parent / ".env.local")
+
+# Source de vérité des assets connus (clé: nom normalisé en minuscules).
+# MappingProxyType: constante de module en lecture seule, construite une
+# fois à l'import; surchargeable par un JSON via --config / config_path.
+_POLITICIANS_ASSETS = MappingProxyType({
+    "sébastien lecornu": {
+        "avatar_url": "/assets/politicians/lecornu.png",
+        "animation_url": "/assets/animations/lecornu.mp4",
+        "highlight": True,
+    },
+    "marine le pen": {
+        "avatar_url": "/assets/politicians/lepen.jpeg",
+        "animation_url": "/assets/animations/lepen.mp4",
+        "highlight": True,
+    },
+    "élisabeth borne": {
+        "avatar_url": "/assets/politicians/borne.png",
+    },
+    "éric lombard": {
+        "avatar_url": "/assets/politicians/lombart.png",
+    },
+})
+
+
+@lru_cache(maxsize=8)
+def _load_config_file(config_path, mtime):
+    """Parse le JSON de config; mtime dans la clé pour invalider le cache
+    dès que le fichier change sur disque."""
+    if orjson is not None:
+        return orjson.loads(Path(config_path).read_bytes())
+    with open(config_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class PoliticiansAssetsUpdater:
+    """Met à jour les colonnes d'assets de la table politicians."""
+
+    def __init__(self):
+        supabase_url = os.getenv("NEXT_PUBLIC_SUPABASE_URL")
+        supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+        if not supabase_url or not supabase_key:
+            print("❌ Variables Supabase manquantes dans .env.local")
+            sys.exit(1)
+        # supabase-py v2 réutilise déjà un httpx.Client partagé (keep-alive)
+        # pour toutes les requêtes PostgREST: pas de handshake TLS par appel.
+        # On fixe seulement des timeouts explicites — connexion courte pour
+        # échouer vite, lecture large pour les upserts groupés.
+        options = SyncClientOptions(
+            postgrest_client_timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+        self.supabase = create_client(supabase_url, supabase_key, options=options)
+
+    def load_assets_config(self, config_path=None):
+        """Mapping nom → assets: depuis un JSON si fourni, sinon la
+        constante de module."""
+        if config_path is None:
+            return _POLITICIANS_ASSETS
+        try:
+            # Relecture et re-parsing évités tant que le fichier n'a pas
+            # changé (appels répétés, service résident, tests).
+            config = _load_config_file(config_path, os.path.getmtime(config_path))
+            return config.get("politicians_assets", config)
+        except (OSError, ValueError) as e:
+            # Fichier illisible ou JSON invalide (orjson lève ValueError)
+            print(f"⚠️ Impossible de lire {config_path}: {e}")
+            return _POLITICIANS_ASSETS
+
+    def add_missing_schema_columns(self):
+        """Rappelle le SQL de schéma à exécuter une fois (colonnes + vue)."""
+        print("🧱 Schéma requis: exécuter une fois dans l'éditeur SQL Supabase")
+        print("   scripts/create-featured-politicians-view.sql")
+
+    def update_politicians_assets(self, politicians_assets=None):
+        """Associe les assets connus aux politiciens correspondants."""
+        if politicians_assets is None:
+            politicians_assets = _POLITICIANS_ASSETS
+
+        print("🎨 Mise à jour des assets des politiciens...")
+        try:
+            try:
+                # Égalité paramétrée sur la colonne générée name_normalized
+                # (voir add-politicians-name-normalized.sql): un seul
+                # aller-retour qui passe par l'index btree.
+                response = (
+                    self.supabase.table("politicians")
+                    .select("id,name,name_normalized,avatar_url,animation_url,highlight")
+                    .in_(
+                        "name_normalized",
+                        [self._normalize_name(k) for k in politicians_assets],
+                    )
+                    .execute()
+                )
+                by_norm = {
+                    found["name_normalized"]: found
+                    for found in response.data
+                }
+                # Le SELECT indexé ne ramène que les égalités exactes
+                complete = False
+            except APIError:
+                # Colonne absente (SQL pas encore exécuté): un SELECT de
+                # toute la table (deux colonnes) et correspondance locale —
+                # toujours mieux que N ilike %nom% non indexables.
+                response = (
+                    self.supabase.table("politicians")
+                    .select("id,name,avatar_url,animation_url,highlight")
+                    .execute()
+                )
+                by_norm = {
+                    self._normalize_name(found.get("name") or ""): found
+                    for found in response.data
+                }
+                complete = True
+
+            # Messages accumulés et émis en une écriture: une seule ligne
+            # de sortie par écriture stdout au lieu de 2-3 par politicien,
+            # et pas d'entrelacement avec la vérification concurrente.
+            rows = []
+            log_lines = []
+            for politician_name, assets in politicians_assets.items():
+                # Une seule passe Unicode de mise en forme par politicien
+                display_name = politician_name.title()
+                needle = self._normalize_name(politician_name)
+                matched = by_norm.get(needle)
+                if matched is None:
+                    if not complete:
+                        # Le SELECT indexé ne contient que les correspondances
+                        # exactes: compléter une seule fois avec la table
+                        # entière pour que le repli ait de quoi chercher.
+                        response = (
+                            self.supabase.table("politicians")
+                            .select("id,name,avatar_url,animation_url,highlight")
+                            .execute()
+                        )
+                        for found in response.data:
+                            by_norm.setdefault(
+                                self._normalize_name(found.get("name") or ""),
+                                found,
+                            )
+                        complete = True
+                    # Repli: sous-chaîne contiguë (même portée que l'ancien
+                    # ilike '%nom%') — tolère un préfixe ou un suffixe en
+                    # base (titre, nom composé), pas un deuxième prénom
+                    # intercalé entre prénom et nom.
+                    matched = next(
+                        (row for norm, row in by_norm.items() if needle in norm),
+                        None,
+                    )
+                if matched is None:
+                    log_lines.append(
+                        f"⚠️ {display_name} introuvable dans la base"
+                    )
+                    continue
+                # Déjà à jour → aucune écriture: le SELECT initial ramène
+                # l'état courant, autant s'en servir pour éviter l'upsert.
+                if all(matched.get(field) == value for field, value in assets.items()):
+                    log_lines.append(
+                        f"⏭️ {display_name} déjà à jour (id {matched['id']})"
+                    )
+                    continue
+                log_lines.append(
+                    f"✅ {display_name} trouvé (id {matched['id']})"
+                )
+                # name est repris du SELECT: la ligne candidate de l'upsert
+                # doit satisfaire name NOT NULL avant résolution du conflit.
+                rows.append({"id": matched["id"], "name": matched["name"], **assets})
+                # avatar_url est facultatif dans un JSON fourni via --config
+                avatar_url = assets.get("avatar_url")
+                if avatar_url:
+                    log_lines.append(f"   🖼️ {display_name}: {avatar_url}")
+            sys.stdout.write("\n".join(log_lines) + "\n")
+
+            if not rows:
+                print("✅ Aucun changement à écrire")
+                return 0
+
+            self._upsert_rows(rows)
+            print(f"🎉 {len(rows)} politiciens mis à jour")
+            return len(rows)
+        except (httpx.HTTPError, APIError) as e:
+            # Relances épuisées: on remonte l'erreur au lieu de l'avaler,
+            # pour qu'un run planté soit visible (code retour non nul).
+            print(f"❌ Erreur pendant la mise à jour des assets: {e}")
+            raise
+
+    def _upsert_with_retry(self, batch, max_attempts=3):
+        """Upsert d'un lot avec relance sur erreur transitoire.
+
+        Seules les erreurs réseau (httpx.TransportError) et les réponses
+        PostgREST hors rejet de payload (400/422) sont relancées, avec
+        backoff exponentiel court — même motif que populate_politicians_db.
+        """
+        for attempt in range(max_attempts):
+            try:
+                # returning='minimal': PostgREST ne sérialise ni ne renvoie
+                # les lignes écrites, qu'on n'utilise pas.
+                self.supabase.table("politicians").upsert(
+                    batch, on_conflict="id", returning="minimal"
+                ).execute()
+                return
+            except (httpx.TransportError, APIError) as e:
+                code = str(getattr(e, "code", "") or "")
+                if code in {"400", "422"} or attempt == max_attempts - 1:
+                    raise
+                time.sleep(min(0.2 * (2 ** attempt), 2.0))
+
+    def _upsert_rows(self, rows, batch_size=500, max_workers=4):
+        """Upsert groupé; au-delà de batch_size lignes, lots concurrents.
+
+        max_workers=4 reste sous la limite de connexions du pooler Supabase.
+        """
+        if len(rows) <= batch_size:
+            self._upsert_with_retry(rows)
+            return
+        batches = [
+            rows[start:start + batch_size]
+            for start in range(0, len(rows), batch_size)
+        ]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as pool:
+            for future in [
+                pool.submit(self._upsert_with_retry, batch) for batch in batches
+            ]:
+                future.result()
+
+    @staticmethod
+    def _normalize_name(name):
+        """Minuscules sans accents: 'Élisabeth Borne' → 'elisabeth borne'."""
+        return (
+            unicodedata.normalize("NFKD", name)
+            .encode("ascii", "ignore")
+            .decode()
+            .lower()
+            .strip()
+        )
+
+    def verify_assets_integration(self):
+        """Liste les politiciens disposant d'assets pour contrôle visuel."""
+        print("🔍 Vérification des assets en base...")
+        try:
+            try:
+                # La vue fait le filtre, le tri et le flag is_featured côté
+                # serveur (voir create-featured-politicians-view.sql).
+                # range(): au plus 200 lignes rapatriées et formatées
+                response = (
+                    self.supabase.table("featured_politicians")
+                    .select("name,avatar_url,animation_url,credibility_score")
+                    .range(0, 199)
+                    .execute()
+                )
+            except APIError:
+                # Vue absente (SQL pas encore exécuté): requête directe
+                print("⚠️ Vue featured_politicians absente — exécuter "
+                      "scripts/create-featured-politicians-view.sql")
+                response = (
+                    self.supabase.table("politicians")
+                    .select("name,avatar_url,animation_url,credibility_score")
+                    .not_.is_("avatar_url", "null")
+                    .order("credibility_score", desc=True)
+                    .range(0, 199)
+                    .execute()
+                )
+            lines = []
+            for politician in response.data:
+                lines.append(f"   🖼️ {politician['name']}: {politician['avatar_url']}")
+                if politician.get("animation_url"):
+                    lines.append(f"   🎬 {politician['name']}: {politician['animation_url']}")
+            lines.append(f"✅ {len(response.data)} politiciens avec assets")
+            # Une seule écriture stdout pour tout le listing
+            sys.stdout.write("\n".join(lines) + "\n")
+            return len(response.data)
+        except (httpx.HTTPError, APIError) as e:
+            # Contrôle visuel seulement: un échec ne doit pas faire
+            # échouer la mise à jour menée en parallèle.
+            print(f"❌ Erreur pendant la vérification: {e}")
+            return 0
+
+    def run_complete_update(self, config_path=None, verify=True):
+        """Pipeline complet: schéma → mise à jour (+ vérification)."""
+        print("🎨 LIAISON DES ASSETS POLITIK CRED'")
+        print("=" * 60)
+        self.add_missing_schema_columns()
+        # La mise à jour et la vérification sont deux conversations
+        # indépendantes avec Supabase (la vérification photographie l'état
+        # courant, c'est un contrôle visuel): les mener de front cache la
+        # latence de l'une derrière celle de l'autre. Deux requêtes en vol
+        # au plus — pas de risque pour le pooler Supabase.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            update_future = executor.submit(
+                self.update_politicians_assets,
+                self.load_assets_config(config_path),
+            )
+            if verify:
+                verify_future = executor.submit(self.verify_assets_integration)
+            updated = update_future.result()
+            if verify:
+                verify_future.result()
+        print("=" * 60)
+        print(f"🎉 Terminé: {updated} politiciens mis à jour")
+        return updated
+
+
+if __name__ == "__main__":
+    updater = PoliticiansAssetsUpdater()
+    # --config <chemin>: JSON surchargeant le mapping d'assets du module
+    # --skip-verify: pas de listing de contrôle (utile en CI)
+    config_path = None
+    if "--config" in sys.argv:
+        config_index = sys.argv.index("--config")
+        if config_index + 1 >= len(sys.argv):
+            print("❌ --config attend un chemin de fichier JSON")
+            sys.exit(1)
+        config_path = sys.argv[config_index + 1]
+    updater.run_complete_update(
+        config_path=config_path,
+        verify="--skip-verify" not in sys.argv,
+    )